@@ -1,5 +1,6 @@
 # pipeline.py
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from src.extract import load_default_raw, load_raw_csv
@@ -29,52 +30,73 @@ def main():
 
     print(f"   Loaded {len(df_raw)} rows from {raw_path}")
 
-    # ------------------------------------------------------------------
-    # 2) CLEAN
-    # ------------------------------------------------------------------
-    print("🧹 Step 2/6: Cleaning data...")
-    df_clean = clean_data(df_raw)
-    print(f"   Cleaning complete. Rows after cleaning: {len(df_clean)}")
-        # SAVE CLEANED DATA
-    cleaned_path = project_root / "data" / "cleaned" / "wnba_cleaned.csv"
-    df_clean.to_csv(cleaned_path, index=False)
-    print(f"   Saved cleaned data → {cleaned_path}")
-
-    # ------------------------------------------------------------------
-    # 3) VALIDATE
-    # ------------------------------------------------------------------
-    print("✅ Step 3/6: Validating data...")
-    validation_errors = validate_data(df_clean)
-    if validation_errors.empty:
-        print("   No validation issues found.")
-    else:
-        print(f"   Validation found {len(validation_errors)} issues.")
-        # SAVE VALIDATION ERRORS
-    validated_path = project_root / "data" / "validated" / "validation_errors.csv"
-    validation_errors.to_csv(validated_path, index=False)
-    print(f"   Saved validation errors → {validated_path}")
-
-    # ------------------------------------------------------------------
-    # 4) ANOMALY DETECTION
-    # ------------------------------------------------------------------
-    print("🔍 Step 4/6: Detecting anomalies...")
-    anomalies = detect_anomalies(df_clean)
-    if anomalies.empty:
-        print("   No anomalies detected.")
-    else:
-        print(f"   Detected {len(anomalies)} anomalous rows.")
-        # SAVE ANOMALIES
-    anomalies_path = project_root / "data" / "anomalies" / "anomalies.csv"
-    anomalies.to_csv(anomalies_path, index=False)
-    print(f"   Saved anomalies → {anomalies_path}")
-
-    # ------------------------------------------------------------------
-    # 5) VISUALIZATIONS
-    # ------------------------------------------------------------------
-    print("📊 Step 5/6: Creating visualizations...")
-    visuals_dir = project_root / "visuals" / "charts"
-    viz_paths = create_visualizations(df_clean, anomalies=anomalies, output_dir=visuals_dir)
-    print(f"   Created {len(viz_paths)} chart(s) in {visuals_dir}")
+    # Artifact writes are I/O bound, so they run on a background thread while the
+    # main thread moves on to the next compute stage.
+    with ThreadPoolExecutor(max_workers=3) as io_pool:
+        # ------------------------------------------------------------------
+        # 2) CLEAN
+        # ------------------------------------------------------------------
+        print("🧹 Step 2/6: Cleaning data...")
+        df_clean = clean_data(df_raw)
+        print(f"   Cleaning complete. Rows after cleaning: {len(df_clean)}")
+            # SAVE CLEANED DATA
+        # Parquet keeps the cleaned dtypes (categories, Arrow strings) and is
+        # far cheaper to write than CSV; zstd level 1 favours write speed.
+        # The index is kept so row labels read back from the file match the
+        # ones reported for the in-memory frame.
+        cleaned_path = project_root / "data" / "cleaned" / "wnba_cleaned.parquet"
+        pending_writes = [
+            io_pool.submit(
+                df_clean.to_parquet,
+                cleaned_path,
+                compression="zstd",
+                compression_level=1,
+            )
+        ]
+        print(f"   Saving cleaned data → {cleaned_path}")
+
+        # ------------------------------------------------------------------
+        # 3) VALIDATE
+        # ------------------------------------------------------------------
+        print("✅ Step 3/6: Validating data...")
+        validation_errors = validate_data(df_clean)
+        if validation_errors.empty:
+            print("   No validation issues found.")
+        else:
+            print(f"   Validation found {len(validation_errors)} issues.")
+            # SAVE VALIDATION ERRORS
+        validated_path = project_root / "data" / "validated" / "validation_errors.csv"
+        pending_writes.append(
+            io_pool.submit(validation_errors.to_csv, validated_path, index=False)
+        )
+        print(f"   Saving validation errors → {validated_path}")
+
+        # ------------------------------------------------------------------
+        # 4) ANOMALY DETECTION
+        # ------------------------------------------------------------------
+        print("🔍 Step 4/6: Detecting anomalies...")
+        anomalies = detect_anomalies(df_clean)
+        if anomalies.empty:
+            print("   No anomalies detected.")
+        else:
+            print(f"   Detected {len(anomalies)} anomalous rows.")
+            # SAVE ANOMALIES
+        anomalies_path = project_root / "data" / "anomalies" / "anomalies.csv"
+        pending_writes.append(io_pool.submit(anomalies.to_csv, anomalies_path, index=False))
+        print(f"   Saving anomalies → {anomalies_path}")
+
+        # ------------------------------------------------------------------
+        # 5) VISUALIZATIONS
+        # ------------------------------------------------------------------
+        print("📊 Step 5/6: Creating visualizations...")
+        visuals_dir = project_root / "visuals" / "charts"
+        viz_paths = create_visualizations(df_clean, anomalies=anomalies, output_dir=visuals_dir)
+        print(f"   Created {len(viz_paths)} chart(s) in {visuals_dir}")
+
+        # make sure every artifact is on disk (and surface any write error)
+        # before the report is produced
+        for future in pending_writes:
+            future.result()
 
     # ------------------------------------------------------------------
     # 6) REPORT
@@ -18,7 +18,19 @@ Validation later will handle:
     “Make sure the data IS right.”
 """
 
+import re
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+
+
+# number of non-null values inspected before trying a full numeric parse
+TYPE_SAMPLE_SIZE = 32
+
+# runs of spaces/hyphens in column names
+_NAME_SEPARATORS = re.compile(r"[\s\-]+")
 
 
 class DataCleaner:
@@ -30,8 +42,11 @@ class DataCleaner:
     # Remove negative numeric values
     # ----------------------------------------------------------
     def remove_negative_rows(self, df: pd.DataFrame) -> pd.DataFrame:
-        numeric_cols = df.select_dtypes(include="number").columns
-        cleaned = df[(df[numeric_cols] >= 0).all(axis=1)]
+        # one compare-and-reduce over the numeric block as a plain ndarray
+        # (NaN compares False, so rows with missing numbers are dropped too)
+        numeric = df.select_dtypes(include="number")
+        values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+        cleaned = df.loc[(values >= 0).all(axis=1)]
         return cleaned
 
     # ----------------------------------------------------------
@@ -39,59 +54,102 @@ class DataCleaner:
     # ----------------------------------------------------------
     def handle_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
         df = df.copy()
+        self._handle_missing_values(df)
+        return df
 
-        # Numeric → mean
-        numeric_cols = df.select_dtypes(include="number").columns
-        for col in numeric_cols:
-            if df[col].isna().any():
-                df[col].fillna(df[col].mean(), inplace=True)
+    def _handle_missing_values(self, df: pd.DataFrame) -> None:
+        # Numeric → mean (all means in one reduction)
+        means = df.select_dtypes(include="number").mean(numeric_only=True)
+        # nullable integer columns (e.g. Int32 from extract) take whole numbers
+        int_cols = df.select_dtypes(include="integer").columns
+        means[int_cols] = means[int_cols].round()
+        fill_map = means.to_dict()
 
-        # Text → "Unknown"
-        object_cols = df.select_dtypes(include="object").columns
-        for col in object_cols:
-            df[col].fillna("Unknown", inplace=True)
+        # Text → "Unknown" (object columns and pandas string dtypes alike)
+        text_cols = df.select_dtypes(include=["object", "string"]).columns
+        fill_map.update(dict.fromkeys(text_cols, "Unknown"))
 
-        return df
+        # categoricals can only be filled with a known category
+        for col in df.select_dtypes(include="category").columns:
+            if df[col].isna().any():
+                if "Unknown" not in df[col].cat.categories:
+                    df[col] = df[col].cat.add_categories("Unknown")
+                fill_map[col] = "Unknown"
+
+        # single fillna over the whole frame instead of one call per column
+        df.fillna(fill_map, inplace=True)
 
     # ---------------------------------------------------------
     # 1. STANDARDIZE COLUMN NAMES
     # ---------------------------------------------------------
     def standardize_column_names(self, df: pd.DataFrame) -> pd.DataFrame:
         df = df.copy()
-        df.columns = (
-            df.columns
-            .str.strip()
-            .str.lower()
-            .str.replace(" ", "_")
-            .str.replace("-", "_")
-        )
+        self._standardize_column_names(df)
         return df
 
+    def _standardize_column_names(self, df: pd.DataFrame) -> None:
+        # the same raw schema arrives on every run, so the mapping is cached
+        rename = _compute_rename(tuple(df.columns))
+        df.columns = [rename.get(col, col) for col in df.columns]
+
     # ---------------------------------------------------------
     # 2. TRIM WHITESPACE FROM TEXT COLUMNS
     # ---------------------------------------------------------
     def trim_whitespace(self, df: pd.DataFrame) -> pd.DataFrame:
         df = df.copy()
-        for col in df.select_dtypes(include="object").columns:
-            df[col] = df[col].astype(str).str.strip()
+        self._trim_whitespace(df)
         return df
 
+    def _trim_whitespace(self, df: pd.DataFrame) -> None:
+        for col in df.select_dtypes(include=["object", "string"]).columns:
+            if df[col].dtype == object:
+                # mixed object column: one pass that strips strings and leaves
+                # everything else (numbers, None) as it was — cheaper than
+                # .str.strip() followed by a fillna to restore non-strings
+                df[col] = pd.Series(
+                    [v.strip() if isinstance(v, str) else v for v in df[col].to_numpy()],
+                    index=df.index,
+                    dtype=object,
+                )
+            else:
+                df[col] = df[col].str.strip()
+
+        # categoricals (e.g. team from extract) only need their labels stripped
+        for col in df.select_dtypes(include="category").columns:
+            categories = df[col].cat.categories
+            if pd.api.types.is_string_dtype(categories):
+                df[col] = _relabel_categories(df[col], categories.str.strip())
+
     # ---------------------------------------------------------
     # 3. FIX DATA TYPES
     # ---------------------------------------------------------
     def fix_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
         df = df.copy()
-        for col in df.columns:
+        self._fix_dtypes(df)
+        return df
+
+    def _fix_dtypes(self, df: pd.DataFrame) -> None:
+        # numeric columns are already fine; only text columns can hold numbers
+        for col in df.select_dtypes(include=["object", "string"]).columns:
+            # a small sample rules out obviously textual columns cheaply
+            sample = df[col].dropna().head(TYPE_SAMPLE_SIZE)
+            if sample.empty or pd.to_numeric(sample, errors="coerce").isna().any():
+                continue
             try:
                 df[col] = pd.to_numeric(df[col])
-            except Exception:
+            except (ValueError, TypeError):
+                # non-numeric values further down — keep the column as text
                 pass
-        return df
 
     # ---------------------------------------------------------
     # 4. STANDARDIZE TEAM NAMES
     # ---------------------------------------------------------
     def normalize_team_names(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = df.copy()
+        self._normalize_team_names(df)
+        return df
+
+    def _normalize_team_names(self, df: pd.DataFrame) -> None:
         TEAM_MAP = {
             "MIN": "Minnesota Lynx",
             "Min": "Minnesota Lynx",
@@ -108,38 +166,107 @@ class DataCleaner:
             "Atlanta Dream": "Atlanta Dream",
         }
 
-        df = df.copy()
-        if "team" in df.columns:
-            df["team"] = df["team"].replace(TEAM_MAP)
-        if "team_name" in df.columns:
-            df["team_name"] = df["team_name"].replace(TEAM_MAP)
-
-        return df
+        for col in ("team", "team_name"):
+            if col in df.columns:
+                # hash lookup via map; names missing from TEAM_MAP stay as-is.
+                # Team is low-cardinality, so store it as a category.
+                teams = df[col]
+                if isinstance(teams.dtype, pd.CategoricalDtype):
+                    # already categorical: map the codebook, not every row
+                    labels = teams.cat.categories.to_series()
+                    mapped = labels.map(TEAM_MAP)
+                    df[col] = _relabel_categories(teams, mapped.where(mapped.notna(), labels))
+                    continue
+                mapped = teams.map(TEAM_MAP)
+                df[col] = mapped.where(mapped.notna(), teams).astype("category")
 
     # ---------------------------------------------------------
     # 5. REMOVE DUPLICATES
     # ---------------------------------------------------------
     def remove_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
         df = df.copy()
+        self._remove_duplicates(df)
+        return df
+
+    def _remove_duplicates(self, df: pd.DataFrame) -> None:
         before = len(df)
-        df = df.drop_duplicates()
+        df.drop_duplicates(inplace=True)
         after = len(df)
         print(f"[clean] Removed {before - after} duplicate rows.")
+
+    # ---------------------------------------------------------
+    # 6. COMPACT TEXT COLUMNS
+    # ---------------------------------------------------------
+    def compact_text_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = df.copy()
+        self._compact_text_columns(df)
         return df
 
+    def _compact_text_columns(self, df: pd.DataFrame) -> None:
+        # low-cardinality labels → category (integer codes + small codebook)
+        for col in ("team", "team_name", "position"):
+            if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype("category")
+
+        # mostly-unique names → contiguous Arrow string buffer
+        if "player_name" in df.columns:
+            names = df["player_name"]
+            if names.dtype == object:
+                # mixed object column (e.g. a stray number): Arrow only takes
+                # strings, so stringify the non-missing values first
+                names = names.astype(str).where(names.notna())
+            df["player_name"] = names.astype(pd.ArrowDtype(pa.large_string()))
+
     # ---------------------------------------------------------
-    # 6. ORCHESTRATE ALL CLEANING STEPS
+    # 7. ORCHESTRATE ALL CLEANING STEPS
     # ---------------------------------------------------------
     def clean(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = self.standardize_column_names(df)
-        df = self.trim_whitespace(df)
-        df = self.fix_dtypes(df)
-        df = self.normalize_team_names(df)
-        df = self.remove_duplicates(df)
-        df = self.handle_missing_values(df)
+        # One copy up front; every step below then works on it in place.
+        # (The public per-step methods each copy, so they stay safe to call
+        # on their own.)
+        df = df.copy()
+        self._standardize_column_names(df)
+        self._trim_whitespace(df)
+        self._fix_dtypes(df)
+        self._normalize_team_names(df)
+        self._remove_duplicates(df)
+        self._handle_missing_values(df)
+        self._compact_text_columns(df)
         return df
 
 
+def standardize_column_name(name: str) -> str:
+    """
+    The pipeline's column-name rule: stripped, lower-case, runs of
+    spaces/hyphens collapsed to a single "_". Extract uses it too, to
+    recognise known columns before cleaning has renamed them.
+    """
+    return _NAME_SEPARATORS.sub("_", name.strip().lower())
+
+
+@lru_cache(maxsize=32)
+def _compute_rename(cols: tuple) -> dict:
+    """Raw column name → standardized name. Non-string labels are left out."""
+    return {col: standardize_column_name(col) for col in cols if isinstance(col, str)}
+
+
+def _relabel_categories(series: pd.Series, labels) -> pd.Series:
+    """
+    Replace each category of `series` with the label at the same position.
+
+    Unlike rename_categories, labels may repeat (e.g. "MIN" and "Minnesota"
+    both becoming "Minnesota Lynx"); those categories are merged.
+    """
+    remap, categories = pd.factorize(pd.Index(labels))
+    # missing values have code -1, which picks the appended -1
+    new_codes = np.append(remap, -1)[series.cat.codes.to_numpy()]
+    return pd.Series(
+        pd.Categorical.from_codes(new_codes, categories=categories),
+        index=series.index,
+        name=series.name,
+    )
+
+
 # ---------------------------------------------------------
 # PIPELINE ENTRY POINT
 # ---------------------------------------------------------
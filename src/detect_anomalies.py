@@ -1,49 +1,203 @@
+from pathlib import Path
+from typing import Optional
+
 import pandas as pd
 import numpy as np
 
+
+# Rows kept per column to estimate quartiles when streaming a file.
+# Up to this many values the quartiles are exact.
+QUANTILE_SAMPLE_SIZE = 200_000
+
+
+def _numeric_matrix(df: pd.DataFrame, columns: Optional[list] = None) -> np.ndarray:
+    """
+    Numeric columns as a 2-D float64 array (NaN for missing values).
+
+    Every statistic below is a per-column reduction, so the array is kept in
+    column-major (Fortran) order: each column is one contiguous run of memory
+    instead of a stride across every row. Current pandas usually hands this
+    layout back already (it is a no-op then); frames wrapping a row-major
+    ndarray would otherwise be scanned across cache lines.
+
+    If `columns` is given, exactly those columns are used (coerced to
+    numbers) instead of the frame's numeric dtypes.
+    """
+    if columns is None:
+        numeric = df.select_dtypes(include="number")
+    else:
+        numeric = df[columns].apply(pd.to_numeric, errors="coerce")
+    return np.asfortranarray(numeric.to_numpy(dtype=np.float64, na_value=np.nan))
+
+
+def _small_sample_mask(values: np.ndarray) -> np.ndarray:
+    """
+    Median distance rule for columns with very few values, on a 2-D block
+    (NaN = missing). In each column with at least 2 values, the value
+    furthest from the median is an outlier if its distance is more than 3x
+    the next largest distance. Returns the rows holding such an outlier.
+    """
+    mask = np.zeros(values.shape[0], dtype=bool)
+
+    # only columns with at least 2 values can have an outlier
+    values = values[:, np.count_nonzero(~np.isnan(values), axis=0) >= 2]
+    if not values.shape[1]:
+        return mask
+
+    diffs = np.abs(values - np.nanmedian(values, axis=0))
+    diffs[np.isnan(diffs)] = -np.inf
+
+    # largest and second-largest distance per column
+    second, first = np.sort(diffs, axis=0)[-2:]
+    hit = first > 3 * second
+    mask[np.argmax(diffs[:, hit], axis=0)] = True
+    return mask
+
+
+def _iqr_z_mask(values, q1, q3, mean, std) -> np.ndarray:
+    """Rows (of a 2-D block) breaking the IQR or z-score rule in any column."""
+    iqr = q3 - q1
+    lower, upper = q1 - 1.5*iqr, q3 + 1.5*iqr
+    iqr_mask = (values < lower) | (values > upper)
+
+    # Use a moderate threshold so extreme values in larger sets are flagged
+    z_scores = np.abs(values - mean) / np.where(std > 0, std, 1.0)
+    z_mask = (z_scores > 2.0) & (std > 0)
+
+    return (iqr_mask | z_mask).any(axis=1)
+
+
 def detect_anomalies(df: pd.DataFrame) -> pd.DataFrame:
     """
     Hybrid anomaly detector:
     - IQR rule for larger data sets
     - Z-score rule for larger data sets
     - Median distance rule for tiny data sets (<5 rows)
+
+    All numeric columns are scored together as one 2-D float array, so the
+    IQR / z-score rules run as whole-matrix NumPy reductions.
     """
     if df.empty:
         return df.copy()
 
-    numeric_cols = df.select_dtypes(include="number").columns
-    anomaly_mask = pd.Series(False, index=df.index)
-
-    for col in numeric_cols:
-        col_data = df[col].dropna()
-        n = len(col_data)
-
-        # Basic rule for very small samples
-        if n < 5:
-            med = np.median(col_data)
-            diffs = np.abs(col_data - med)
-            # If there are at least 2 points, compare largest diff to second largest
-            if len(diffs) > 1:
-                sorted_diffs = np.sort(diffs)
-                if sorted_diffs[-1] > 3 * sorted_diffs[-2]:
-                    outlier_idx = diffs.idxmax()
-                    anomaly_mask[outlier_idx] = True
-            continue
-
-        # Otherwise use IQR and Z-score rules
-        q1, q3 = col_data.quantile([0.25, 0.75])
-        iqr = q3 - q1
-        lower, upper = q1 - 1.5*iqr, q3 + 1.5*iqr
-        iqr_mask = (df[col] < lower) | (df[col] > upper)
-
-        mean = col_data.mean()
-        std  = col_data.std(ddof=0)
-        z_mask = pd.Series(False, index=df.index)
-        if std > 0:
-            z_scores = (df[col] - mean) / std
-            # Use a moderate threshold so extreme values in larger sets are flagged
-            z_mask = z_scores.abs() > 2.0
-
-        anomaly_mask |= iqr_mask | z_mask
-
-    return df[anomaly_mask].copy()
\ No newline at end of file
+    values = _numeric_matrix(df)
+    anomaly_mask = np.zeros(len(df), dtype=bool)
+
+    # non-missing values per column decide which rule applies
+    counts = np.count_nonzero(~np.isnan(values), axis=0)
+    small = counts < 5
+
+    # Basic rule for very small samples
+    anomaly_mask |= _small_sample_mask(values[:, small])
+
+    # Otherwise use IQR and Z-score rules, for every remaining column at once
+    large = values[:, ~small]
+    if large.shape[1]:
+        q1, q3 = np.nanpercentile(large, [25, 75], axis=0)
+        mean = np.nanmean(large, axis=0)
+        std = np.nanstd(large, axis=0)
+        anomaly_mask |= _iqr_z_mask(large, q1, q3, mean, std)
+
+    return df[anomaly_mask].copy()
+
+
+def detect_anomalies_chunked(
+    path: str | Path,
+    chunksize: int = 1_000_000,
+    sample_size: int = QUANTILE_SAMPLE_SIZE,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Same rules as detect_anomalies, but streamed over a CSV in chunks so the
+    full table never has to fit in memory.
+
+    - Pass 1 accumulates count/mean/M2 per numeric column (exact mean and
+      std, merged chunk by chunk) plus a uniform sample of at most
+      `sample_size` values per column for the quartiles.
+    - Pass 2 re-reads the file and keeps only the anomalous rows.
+
+    Columns are typed from the first chunk. Results match
+    detect_anomalies(pd.read_csv(path)) whenever no column has more than
+    `sample_size` values; beyond that the IQR bounds are sample estimates.
+    The returned index holds the row positions in the file.
+    """
+    rng = np.random.default_rng(seed)
+
+    numeric_cols = None
+    n = mean = m2 = None
+    # per column: (random keys, values, row positions) of the kept sample
+    samples = []
+
+    # ---- pass 1: column summaries ----
+    offset = 0
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        if numeric_cols is None:
+            numeric_cols = list(chunk.select_dtypes(include="number").columns)
+            k = len(numeric_cols)
+            n, mean, m2 = np.zeros(k), np.zeros(k), np.zeros(k)
+            samples = [(np.empty(0), np.empty(0), np.empty(0, dtype=np.int64))] * k
+
+        values = _numeric_matrix(chunk, numeric_cols)
+        present = ~np.isnan(values)
+
+        # Chan et al. pairwise merge of (count, mean, M2)
+        c_n = present.sum(axis=0).astype(np.float64)
+        c_mean = np.divide(
+            np.nansum(values, axis=0), c_n, out=np.zeros_like(c_n), where=c_n > 0
+        )
+        c_m2 = np.nansum((values - c_mean) ** 2, axis=0)
+        total = n + c_n
+        delta = c_mean - mean
+        frac = np.divide(c_n, total, out=np.zeros_like(c_n), where=total > 0)
+        mean = mean + delta * frac
+        m2 = m2 + c_m2 + delta**2 * n * frac
+        n = total
+
+        # bounded uniform sample: keep the values with the smallest random keys
+        for j in range(len(numeric_cols)):
+            rows = np.flatnonzero(present[:, j])
+            keys, vals, pos = samples[j]
+            keys = np.concatenate([keys, rng.random(len(rows))])
+            vals = np.concatenate([vals, values[rows, j]])
+            pos = np.concatenate([pos, rows + offset])
+            if len(keys) > sample_size:
+                keep = np.argpartition(keys, sample_size)[:sample_size]
+                keys, vals, pos = keys[keep], vals[keep], pos[keep]
+            samples[j] = (keys, vals, pos)
+
+        offset += len(chunk)
+
+    if numeric_cols is None:
+        return pd.read_csv(path)  # header only — nothing to score
+
+    # ---- finalize statistics ----
+    small = n < 5
+    flagged = set()
+    for j in np.flatnonzero(small):
+        _, vals, pos = samples[j]  # fewer than 5 values: the sample is all of them
+        order = np.argsort(pos)
+        outlier = _small_sample_mask(vals[order][:, None])
+        flagged.update(pos[order][outlier].tolist())
+
+    large = np.flatnonzero(~small)
+    q1 = np.array([np.percentile(samples[j][1], 25) for j in large])
+    q3 = np.array([np.percentile(samples[j][1], 75) for j in large])
+    std = np.sqrt(m2[large] / n[large])
+
+    # ---- pass 2: keep anomalous rows only ----
+    parts = []
+    offset = 0
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        mask = np.zeros(len(chunk), dtype=bool)
+        if len(large):
+            values = _numeric_matrix(chunk, [numeric_cols[j] for j in large])
+            mask |= _iqr_z_mask(values, q1, q3, mean[large], std)
+        for position in flagged:
+            if offset <= position < offset + len(chunk):
+                mask[position - offset] = True
+
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+        parts.append(chunk[mask])
+        offset += len(chunk)
+
+    return pd.concat(parts)
@@ -1,30 +1,197 @@
 # src/extract.py
 
+import csv
+import hashlib
+import re
 from pathlib import Path
+from typing import Iterable, Optional
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pac
+import pyarrow.parquet as pq
 
+from src.clean import standardize_column_name
 
-def load_raw_csv(path: str | Path) -> pd.DataFrame:
+
+# Arrow's parser splits the file into blocks and converts them on several
+# threads; 4 MiB blocks keep every core busy without huge per-block buffers.
+CSV_BLOCK_SIZE = 1 << 22
+
+# Known WNBA columns (by standardized name) and the types to parse them as,
+# so Arrow doesn't have to infer them and numbers get compact widths.
+KNOWN_COLUMN_TYPES = {
+    "player_name": pa.string(),
+    "points_per_game": pa.float32(),
+    "assists_per_game": pa.float32(),
+    "rebounds_per_game": pa.float32(),
+    "games_played": pa.int32(),
+    # low-cardinality labels arrive as dictionary arrays, i.e. pandas categoricals
+    "team": pa.dictionary(pa.int32(), pa.string()),
+    "team_name": pa.dictionary(pa.int32(), pa.string()),
+}
+
+# pandas dtypes for the compact Arrow types: nullable Int32/Float32, so a
+# missing value doesn't force an int32 column up to float64 (or a float32
+# one up to NaN-carrying float64) on conversion
+PANDAS_TYPES = {
+    pa.int32(): pd.Int32Dtype(),
+    pa.float32(): pd.Float32Dtype(),
+}
+
+# part of the cache key, so caches parsed under other types are not reused
+_SCHEMA_TAG = hashlib.sha1(repr(sorted(KNOWN_COLUMN_TYPES.items())).encode()).hexdigest()[:8]
+
+
+def load_raw_csv(path: str | Path, use_cache: bool = True) -> pd.DataFrame:
     """
     Load a raw CSV file into a pandas DataFrame.
 
     - Raises FileNotFoundError if the file doesn't exist.
     - Raises ValueError if the file exists but is empty.
+
+    The parsed table is cached as an Arrow IPC file next to the CSV
+    (``<name>.<mtime_ns>_<size>_<schema>.arrow``). Later loads of the
+    unchanged file memory-map that cache instead of parsing again; editing
+    the CSV (or KNOWN_COLUMN_TYPES) changes the key, and stale cache files
+    are removed on the next parse.
     """
     path = Path(path)
 
     if not path.exists():
         raise FileNotFoundError(f"CSV file not found: {path}")
 
+    stat = path.stat()
+    if stat.st_size == 0:
+        raise ValueError(f"CSV file '{path}' is empty.")
+
+    cache_path = path.with_suffix(
+        f".{stat.st_mtime_ns}_{stat.st_size}_{_SCHEMA_TAG}.arrow"
+    )
+
+    if use_cache and cache_path.exists():
+        try:
+            return _read_arrow_cache(cache_path)
+        except (OSError, pa.ArrowException):
+            pass  # unreadable cache — fall through and re-parse
+
     try:
-        df = pd.read_csv(path)
+        table = _read_csv_arrow(path)
     except Exception as e:
         raise ValueError(f"Failed to read CSV file '{path}': {e}") from e
 
-    if df.empty:
+    if table.num_rows == 0:
         raise ValueError(f"CSV file '{path}' is empty.")
 
-    return df
+    if use_cache:
+        _write_arrow_cache(table, path, cache_path)
+
+    return table.to_pandas(types_mapper=PANDAS_TYPES.get)
+
+
+def _read_csv_arrow(path: Path) -> pa.Table:
+    """
+    Parse a CSV with pyarrow's multithreaded reader.
+
+    Known columns are parsed with the types in KNOWN_COLUMN_TYPES. If the
+    data doesn't fit them (e.g. text in a numeric column — exactly what
+    validation is there to report), the file is re-parsed with inferred
+    types instead of failing the load; dictionary (team) columns keep their
+    type, since any text fits them.
+
+    Empty text fields become missing values, matching pd.read_csv.
+    """
+    read_options = pac.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE)
+    column_types = _known_column_types(path)
+
+    if column_types:
+        try:
+            return pac.read_csv(
+                path,
+                read_options=read_options,
+                convert_options=pac.ConvertOptions(
+                    column_types=column_types, strings_can_be_null=True
+                ),
+            )
+        except pa.ArrowInvalid:
+            column_types = {
+                name: t for name, t in column_types.items() if pa.types.is_dictionary(t)
+            }
+
+    return pac.read_csv(
+        path,
+        read_options=read_options,
+        convert_options=pac.ConvertOptions(
+            column_types=column_types, strings_can_be_null=True
+        ),
+    )
+
+
+def _known_column_types(path: Path) -> dict:
+    """Map the file's own header names onto KNOWN_COLUMN_TYPES."""
+    with open(path, newline="", encoding="utf-8") as f:
+        header = next(csv.reader(f), [])
+
+    types = {}
+    for name in header:
+        key = standardize_column_name(name)
+        if key in KNOWN_COLUMN_TYPES:
+            types[name] = KNOWN_COLUMN_TYPES[key]
+    return types
+
+
+def _read_arrow_cache(cache_path: Path) -> pd.DataFrame:
+    with pa.memory_map(str(cache_path)) as source:
+        return pa.ipc.open_file(source).read_all().to_pandas(types_mapper=PANDAS_TYPES.get)
+
+
+def _write_arrow_cache(table: pa.Table, path: Path, cache_path: Path) -> None:
+    """Write the parsed table to cache_path and drop caches for older versions."""
+    # exactly this file's cache names: <stem>.<mtime_ns>_<size>_<schema>.arrow
+    # (a looser glob would also match e.g. the caches of "<stem>.2023.csv")
+    own_cache = re.compile(re.escape(path.stem) + r"\.\d+_\d+_[0-9a-f]{8}\.arrow")
+    try:
+        for stale in path.parent.glob(f"{path.stem}.*.arrow"):
+            if stale != cache_path and own_cache.fullmatch(stale.name):
+                stale.unlink()
+        with pa.OSFile(str(cache_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    except OSError:
+        # the cache is an optimisation only (e.g. read-only data directory)
+        cache_path.unlink(missing_ok=True)
+
+
+def load_parquet(path: str | Path, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Load a Parquet artifact (e.g. the cleaned dataset) into a DataFrame.
+
+    Only the requested `columns` that exist in the file are read — Parquet
+    is columnar, so the others are never touched on disk. `None` reads all.
+
+    - Raises FileNotFoundError if the file doesn't exist.
+    """
+    path = Path(path)
+
+    if not path.exists():
+        raise FileNotFoundError(f"Parquet file not found: {path}")
+
+    if columns is not None:
+        available = set(parquet_columns(path))
+        columns = [col for col in columns if col in available]
+
+    return pd.read_parquet(path, columns=columns)
+
+
+def parquet_shape(path: str | Path) -> tuple[int, int]:
+    """(rows, columns) of a Parquet file, from its footer metadata alone."""
+    return pq.read_metadata(path).num_rows, len(parquet_columns(path))
+
+
+def parquet_columns(path: str | Path) -> list[str]:
+    """Data column names of a Parquet file (stored pandas index excluded)."""
+    schema = pq.read_schema(path)
+    index_cols = (schema.pandas_metadata or {}).get("index_columns", [])
+    return [name for name in schema.names if name not in index_cols]
 
 
 def load_default_raw() -> pd.DataFrame:
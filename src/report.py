@@ -3,17 +3,65 @@
 from pathlib import Path
 from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+from PIL import Image
 
+from src.extract import load_parquet, parquet_shape
 
-def generate_report(
+
+def _summary_lines(
     df_clean: pd.DataFrame,
+    anomalies: pd.DataFrame,
+    validation_errors: pd.DataFrame,
+    n_failure_cases: int,
+    shape: Optional[tuple[int, int]] = None,
+) -> list[str]:
+    """
+    Text lines for the summary page. `shape` overrides df_clean.shape when
+    only some columns of the dataset were loaded.
+    """
+    n_rows, n_cols = shape or df_clean.shape
+    n_teams = df_clean["team"].nunique() if "team" in df_clean.columns else "N/A"
+    n_anomalies = len(anomalies)
+    n_issues = len(validation_errors)
+
+    lines = [
+        "WNBA Data Quality Report",
+        "",
+        f"Total records: {n_rows}",
+        f"Total columns: {n_cols}",
+        f"Number of teams: {n_teams}",
+        "",
+        f"Anomalies detected: {n_anomalies}",
+        f"Validation issues: {n_issues}",
+    ]
+
+    if n_issues > 0:
+        # only the rows that are shown are ever materialized — one tolist()
+        # call instead of building a Series per row with iterrows()
+        shown = validation_errors.head(n_failure_cases).reindex(
+            columns=["severity", "code", "message"], fill_value=""
+        )
+        lines += ["", f"Example validation issues (showing {len(shown)} of {n_issues}):"]
+        lines += [
+            f"  - [{severity}] {code}: {message}"
+            for severity, code, message in shown.to_numpy().tolist()
+        ]
+
+    return lines
+
+
+def generate_report(
+    df_clean: pd.DataFrame | str | Path,
     anomalies: Optional[pd.DataFrame],
     validation_errors: Optional[pd.DataFrame],
     viz_paths: Dict[str, Path],
     output_path: str | Path = "reports/wnba_data_quality_report.pdf",
+    n_failure_cases: int = 3,
 ) -> Path:
     """
     Generate a multi-page PDF data quality report.
@@ -21,11 +69,22 @@ def generate_report(
     - Page 1: summary (row counts, teams, anomalies, validation issues)
     - Additional pages: one per visualization image.
 
+    At most `n_failure_cases` validation issues are listed on page 1, so
+    report size does not grow with the number of errors.
+
+    `df_clean` may also be the path of the cleaned Parquet file; only its
+    team column is read, and the row/column counts come from the footer.
+
     Returns the Path to the generated PDF.
     """
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    shape = None
+    if not isinstance(df_clean, pd.DataFrame):
+        shape = parquet_shape(df_clean)
+        df_clean = load_parquet(df_clean, columns=["team"])
+
     # Normalize None → empty DataFrame
     if anomalies is None:
         anomalies = pd.DataFrame()
@@ -34,78 +93,56 @@ def generate_report(
 
     with PdfPages(output_path) as pdf:
         # -------- Page 1: Text summary --------
-        fig, ax = plt.subplots(figsize=(8.5, 11))  # portrait A4-ish
+        # pages are plain Figure objects — no pyplot registry involved
+        fig = Figure(figsize=(8.5, 11))  # portrait A4-ish
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
         ax.axis("off")
 
-        n_rows = len(df_clean)
-        n_cols = len(df_clean.columns)
-        n_teams = df_clean["team"].nunique() if "team" in df_clean.columns else "N/A"
-        n_anomalies = len(anomalies)
-        n_issues = len(validation_errors)
-
-        lines = [
-            "WNBA Data Quality Report",
-            "",
-            f"Total records: {n_rows}",
-            f"Total columns: {n_cols}",
-            f"Number of teams: {n_teams}",
-            "",
-            f"Anomalies detected: {n_anomalies}",
-            f"Validation issues: {n_issues}",
-        ]
-
-        y = 0.9
-        for line in lines:
-            ax.text(
-                0.1,
-                y,
-                line,
-                fontsize=12 if line else 10,
-                transform=ax.transAxes,
-                va="top",
-                ha="left",
-            )
-            y -= 0.05 if line else 0.03
-
-        if n_issues > 0:
-            ax.text(
-                0.1,
-                y - 0.02,
-                "Example validation issues:",
-                fontsize=11,
-                transform=ax.transAxes,
-                va="top",
-                ha="left",
-            )
-            y -= 0.08
-            # Show up to 3 sample issues
-            for _, row in validation_errors.head(3).iterrows():
-                msg = f"- [{row.get('severity', '')}] {row.get('code', '')}: {row.get('message', '')}"
-                ax.text(
-                    0.12,
-                    y,
-                    msg,
-                    fontsize=9,
-                    transform=ax.transAxes,
-                    va="top",
-                    ha="left",
-                )
-                y -= 0.04
+        lines = _summary_lines(df_clean, anomalies, validation_errors, n_failure_cases, shape)
+
+        # one text artist for the whole block — matplotlib lays it out once
+        ax.text(
+            0.1,
+            0.9,
+            "\n".join(lines),
+            family="monospace",
+            fontsize=11,
+            linespacing=1.6,
+            transform=ax.transAxes,
+            va="top",
+            ha="left",
+        )
 
         pdf.savefig(fig)
-        plt.close(fig)
+        fig.clear()
 
         # -------- Next pages: charts from viz_paths --------
         for name, img_path in viz_paths.items():
             if not Path(img_path).exists():
                 continue
 
-            fig, ax = plt.subplots(figsize=(8.5, 11))
-            img = plt.imread(img_path)
-            ax.imshow(img)
-            ax.axis("off")
-            ax.set_title(name.replace("_", " ").title(), fontsize=14)
-            pdf.savefig(fig)
-            plt.close(fig)
+            # Place the decoded pixels straight onto the page with figimage
+            # instead of routing them through an Axes (imshow → resample →
+            # rasterize). The page DPI is chosen so the chart fits at its
+            # native resolution.
+            with Image.open(img_path) as im:
+                img = np.asarray(im.convert("RGBA"))
+            height, width = img.shape[:2]
+            page_w, page_h = 8.5, 11
+            dpi = max(100, width / (page_w - 0.5), height / (page_h - 1.5))
+
+            fig = Figure(figsize=(page_w, page_h), dpi=dpi)
+            FigureCanvasAgg(fig)
+            fig.figimage(
+                img,
+                xo=(page_w * dpi - width) / 2,
+                yo=(page_h * dpi - height) / 2,
+            )
+            fig.suptitle(name.replace("_", " ").title(), fontsize=14)
+            pdf.savefig(fig, dpi=dpi)
+            # release the page (and its pixel buffer) before decoding the next
+            # chart rather than leaving it to the cyclic garbage collector
+            fig.clear()
 
     return output_path
\ No newline at end of file
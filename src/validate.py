@@ -15,9 +15,41 @@ This module checks:
 and returns a structured list/DataFrame of validation errors.
 """
 
-from typing import List, Optional
+from itertools import repeat
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+import numpy as np
 import pandas as pd
 
+from src.extract import load_parquet
+
+
+ERROR_COLUMNS = ["row", "column", "severity", "code", "message"]
+
+# every column some check looks at — all that is read from a Parquet input
+VALIDATION_COLUMNS = [
+    "player_name",
+    "team",
+    "position",
+    "points_per_game",
+    "assists_per_game",
+    "rebounds_per_game",
+    "games_played",
+]
+
+# Known teams — you can expand this as you add more
+ALLOWED_TEAMS = frozenset({
+    "Minnesota Lynx",
+    "Las Vegas Aces",
+    "Atlanta Dream",
+})
+
+# Allowed player positions (basic model)
+ALLOWED_POSITIONS = frozenset({"G", "F", "C", "G/F", "F/C"})
+
+# Text that float() reads as NaN; numeric checks skip it as missing
+NAN_SPELLINGS = frozenset({"nan", "+nan", "-nan"})
+
 
 class DataValidator:
     """
@@ -30,8 +62,52 @@ class DataValidator:
     """
 
     def __init__(self):
-        # each error is a dict: {row, column, severity, code, message}
-        self.errors: List[dict] = []
+        self._allowed_teams = ALLOWED_TEAMS
+        self._allowed_positions = ALLOWED_POSITIONS
+
+        # errors are stored as blocks — one per add_error(s) call, holding the
+        # failing row labels as an array plus the fields shared by the block —
+        # rather than one dict per error; see `errors` / `to_frame()`
+        self._reset()
+
+    def _reset(self):
+        self._blocks: List[dict] = []
+
+    @property
+    def errors(self) -> List[dict]:
+        """Recorded errors as dicts: {row, column, severity, code, message}."""
+        errors = []
+        for block in self._blocks:
+            rows = block["row"].tolist()
+            messages = block["message"]
+            if isinstance(messages, str):
+                messages = repeat(messages, len(rows))
+            errors.extend(
+                {
+                    "row": row,
+                    "column": block["column"],
+                    "severity": block["severity"],
+                    "code": block["code"],
+                    "message": message,
+                }
+                for row, message in zip(rows, messages)
+            )
+        return errors
+
+    def to_frame(self) -> pd.DataFrame:
+        """Recorded errors as a DataFrame: one frame per block, concatenated once."""
+        frames = [
+            pd.DataFrame(block, columns=ERROR_COLUMNS)  # scalars broadcast
+            for block in self._blocks
+            if len(block["row"])
+        ]
+        if not frames:
+            return pd.DataFrame(columns=ERROR_COLUMNS)
+
+        errors_df = pd.concat(frames, ignore_index=True).infer_objects()
+        errors_df["severity"] = pd.Categorical(errors_df["severity"])
+        errors_df["code"] = pd.Categorical(errors_df["code"])
+        return errors_df
 
     # ----------------------------------------------------------
     # Helper: record an error
@@ -45,29 +121,73 @@ class DataValidator:
         row: Optional[int] = None,
         column: Optional[str] = None,
     ):
-        self.errors.append(
+        self.add_errors(
+            code=code,
+            messages=[message],
+            rows=[row],
+            severity=severity,
+            column=column,
+        )
+
+    # ----------------------------------------------------------
+    # Helper: record many errors of the same kind at once
+    # ----------------------------------------------------------
+    def add_errors(
+        self,
+        *,
+        code: str,
+        messages: Union[str, Iterable[str]],
+        rows: Iterable,
+        severity: str = "ERROR",
+        column: Optional[str] = None,
+    ):
+        """
+        Record one error per entry in `rows` (index labels, e.g. straight
+        from a boolean mask). `messages` is either one message per row or a
+        single string shared by all of them.
+        """
+        rows = np.asarray(rows)
+        if not isinstance(messages, str):
+            messages = list(messages)
+        self._blocks.append(
             {
-                "row": row,
+                "row": rows,
                 "column": column,
                 "severity": severity,
                 "code": code,
-                "message": message,
+                "message": messages,
             }
         )
 
+    # ----------------------------------------------------------
+    # Helper: facts about the frame shared by every check
+    # ----------------------------------------------------------
+    def build_context(self, df: pd.DataFrame) -> dict:
+        """
+        Precompute what several checks need, so the frame is scanned once
+        instead of once per check. Each check accepts this dict as `ctx`
+        (and builds its own when called standalone).
+        """
+        return {
+            "cols": set(df.columns),
+            "index": df.index.to_numpy(),
+            "isna": df.isna(),
+        }
+
     # ----------------------------------------------------------
     # 1. REQUIRED COLUMNS
     # ----------------------------------------------------------
-    def check_required_columns(self, df: pd.DataFrame):
+    def check_required_columns(self, df: pd.DataFrame, ctx: Optional[dict] = None):
         required = [
             "player_name",
             "team",
             "points_per_game",
             "games_played",
         ]
+        cols = (ctx or self.build_context(df))["cols"]
 
         for col in required:
-            if col not in df.columns:
+            if col not in cols:
                 self.add_error(
                     code="MISSING_COLUMN",
                     message=f"Missing required column: {col}",
@@ -79,7 +199,7 @@ class DataValidator:
     # ----------------------------------------------------------
     # 2. NUMERIC RANGE CHECKS
     # ----------------------------------------------------------
-    def check_numeric_ranges(self, df: pd.DataFrame):
+    def check_numeric_ranges(self, df: pd.DataFrame, ctx: Optional[dict] = None):
         """
         Check that numeric values fall in realistic ranges.
         You can expand these rules as the model evolves.
@@ -90,149 +210,177 @@ class DataValidator:
             "rebounds_per_game": {"min": 0, "max": 30},
             "games_played": {"min": 0, "max": 50},  # WNBA seasons are short
         }
+        ctx = ctx or self.build_context(df)
 
         for col, bounds in rules.items():
-            if col not in df.columns:
+            if col not in ctx["cols"]:
                 continue
 
             min_val = bounds["min"]
             max_val = bounds["max"]
 
-            for idx, value in df[col].items():
-                # skip NaNs — missingness is handled elsewhere
-                if pd.isna(value):
-                    continue
-                try:
-                    v = float(value)
-                except Exception:
-                    self.add_error(
-                        code="INVALID_NUMERIC",
-                        message=f"Non-numeric value in numeric field '{col}': {value!r}",
-                        row=idx,
-                        column=col,
-                        severity="ERROR",
-                    )
-                    continue
-
-                if v < min_val or v > max_val:
-                    self.add_error(
-                        code="OUT_OF_RANGE",
-                        message=f"Value {v} in '{col}' outside [{min_val}, {max_val}]",
-                        row=idx,
-                        column=col,
-                        severity="ERROR",
-                    )
+            # one vectorized pass per column instead of a per-cell float() loop;
+            # NaNs are skipped — missingness is handled elsewhere
+            orig = df[col]
+            coerced = pd.to_numeric(orig, errors="coerce")
+            bad_type = (coerced.isna() & ~ctx["isna"][col]).to_numpy(copy=True)
+            flagged = np.flatnonzero(bad_type)
+            if flagged.size:
+                # float() accepted the text "nan" (any case or sign), which
+                # then failed neither range check — it is not a bad value
+                text = orig.iloc[flagged].astype(str).str.strip().str.lower()
+                bad_type[flagged[text.isin(NAN_SPELLINGS).to_numpy()]] = False
+            out_of_range = (coerced < min_val) | (coerced > max_val)
+
+            orig_values = orig.to_numpy()
+            # keep float32 columns in float32 so messages show "26.9", not its
+            # float64 expansion
+            value_dtype = np.float32 if coerced.dtype in (np.float32, pd.Float32Dtype()) else np.float64
+            coerced_values = coerced.to_numpy(dtype=value_dtype, na_value=np.nan)
+
+            idx = np.flatnonzero(bad_type)
+            self.add_errors(
+                code="INVALID_NUMERIC",
+                messages=[
+                    f"Non-numeric value in numeric field '{col}': {orig_values[i]!r}"
+                    for i in idx
+                ],
+                rows=ctx["index"][idx],
+                column=col,
+                severity="ERROR",
+            )
+
+            # nullable (Int32/Float32) columns compare to NA where missing
+            idx = np.flatnonzero(out_of_range.to_numpy(dtype=bool, na_value=False))
+            self.add_errors(
+                code="OUT_OF_RANGE",
+                messages=[
+                    f"Value {coerced_values[i]!s} in '{col}' outside [{min_val}, {max_val}]"
+                    for i in idx
+                ],
+                rows=ctx["index"][idx],
+                column=col,
+                severity="ERROR",
+            )
 
     # ----------------------------------------------------------
     # 3. ALLOWED CATEGORICAL VALUES
     # ----------------------------------------------------------
-    def check_allowed_values(self, df: pd.DataFrame):
+    def check_allowed_values(self, df: pd.DataFrame, ctx: Optional[dict] = None):
         """
         Ensure that categorical values come from a known set.
         """
+        ctx = ctx or self.build_context(df)
+
+        # one hashed isin() per column; messages only for the failing rows
+        if "team" in ctx["cols"]:
+            teams = df["team"]
+            bad = ~ctx["isna"]["team"] & ~teams.isin(self._allowed_teams)
+            idx = np.flatnonzero(bad.to_numpy())
+            values = teams.to_numpy()
+            self.add_errors(
+                code="INVALID_TEAM",
+                messages=[f"Unknown team: {values[i]}" for i in idx],
+                rows=ctx["index"][idx],
+                column="team",
+                severity="WARNING",  # could be ERROR if you want stricter rules
+            )
 
-        # Known teams — you can expand this as you add more
-        allowed_teams = {
-            "Minnesota Lynx",
-            "Las Vegas Aces",
-            "Atlanta Dream",
-        }
-
-        if "team" in df.columns:
-            for idx, value in df["team"].items():
-                if pd.isna(value):
-                    continue
-                if value not in allowed_teams:
-                    self.add_error(
-                        code="INVALID_TEAM",
-                        message=f"Unknown team: {value}",
-                        row=idx,
-                        column="team",
-                        severity="WARNING",  # could be ERROR if you want stricter rules
-                    )
-
-        # Allowed player positions (basic model)
-        allowed_positions = {"G", "F", "C", "G/F", "F/C"}
-
-        if "position" in df.columns:
-            for idx, value in df["position"].items():
-                if pd.isna(value):
-                    continue
-                if value not in allowed_positions:
-                    self.add_error(
-                        code="INVALID_POSITION",
-                        message=f"Unexpected position value: {value}",
-                        row=idx,
-                        column="position",
-                        severity="WARNING",
-                    )
+        if "position" in ctx["cols"]:
+            positions = df["position"]
+            bad = ~ctx["isna"]["position"] & ~positions.isin(self._allowed_positions)
+            idx = np.flatnonzero(bad.to_numpy())
+            values = positions.to_numpy()
+            self.add_errors(
+                code="INVALID_POSITION",
+                messages=[f"Unexpected position value: {values[i]}" for i in idx],
+                rows=ctx["index"][idx],
+                column="position",
+                severity="WARNING",
+            )
 
     # ----------------------------------------------------------
     # 4. MISSING CRITICAL VALUES
     # ----------------------------------------------------------
-    def check_missing_critical_values(self, df: pd.DataFrame):
+    def check_missing_critical_values(self, df: pd.DataFrame, ctx: Optional[dict] = None):
         """
         Check that critical fields like player_name and team are present
         and not left as 'Unknown' after cleaning.
         """
-        for idx, row in df.iterrows():
-
-            if "player_name" in df.columns:
-                name = row["player_name"]
-                if pd.isna(name) or str(name).strip() == "" or str(name) == "Unknown":
-                    self.add_error(
-                        code="MISSING_PLAYER_NAME",
-                        message="Missing or Unknown player_name",
-                        row=idx,
-                        column="player_name",
-                        severity="ERROR",
-                    )
-
-            if "team" in df.columns:
-                team = row["team"]
-                if pd.isna(team) or str(team).strip() == "":
-                    self.add_error(
-                        code="MISSING_TEAM",
-                        message="Missing team value",
-                        row=idx,
-                        column="team",
-                        severity="ERROR",
-                    )
+        # column-wise masks instead of boxing every row with iterrows()
+        ctx = ctx or self.build_context(df)
+        index = ctx["index"]
+
+        if "player_name" in ctx["cols"]:
+            names = df["player_name"].astype("string")
+            # blank once stripped, or exactly the "Unknown" placeholder cleaning fills in
+            bad = ctx["isna"]["player_name"] | (names.str.strip() == "") | (names == "Unknown")
+            bad_rows = index[bad.to_numpy(dtype=bool)]
+            self.add_errors(
+                code="MISSING_PLAYER_NAME",
+                messages="Missing or Unknown player_name",
+                rows=bad_rows,
+                column="player_name",
+                severity="ERROR",
+            )
+
+        if "team" in ctx["cols"]:
+            teams = df["team"]
+            bad = ctx["isna"]["team"] | (teams.astype("string").str.strip() == "")
+            bad_rows = index[bad.to_numpy(dtype=bool)]
+            self.add_errors(
+                code="MISSING_TEAM",
+                messages="Missing team value",
+                rows=bad_rows,
+                column="team",
+                severity="ERROR",
+            )
 
     # ----------------------------------------------------------
     # 5. DUPLICATE CHECKS
     # ----------------------------------------------------------
-    def check_duplicates(self, df: pd.DataFrame):
+    def check_duplicates(self, df: pd.DataFrame, ctx: Optional[dict] = None):
         """
         Check for duplicate players (simplified).
         """
+        cols = (ctx or self.build_context(df))["cols"]
 
         # EARLY EXIT — this fixes your KeyError
-        if "team" not in df.columns:
+        if "team" not in cols:
             return
 
-        if "player_name" not in df.columns:
+        if "player_name" not in cols:
             return
 
         dup_mask = df.duplicated(subset=["player_name", "team"], keep=False)
         duplicated_rows = df[dup_mask]
 
-        for idx, row in duplicated_rows.iterrows():
-            self.add_error(
-                code="DUPLICATE_PLAYER",
-                message=f"Duplicate player/team combination: {row['player_name']} / {row.get('team')}",
-                row=idx,
-                column=None,
-                severity="WARNING",
+        # plain Python values, so categorical/Arrow columns and empty frames
+        # format the same way ("nan", "None", "<NA>" as the f-string shows them)
+        messages = [
+            f"Duplicate player/team combination: {name} / {team}"
+            for name, team in zip(
+                duplicated_rows["player_name"].tolist(),
+                duplicated_rows["team"].tolist(),
             )
+        ]
+        self.add_errors(
+            code="DUPLICATE_PLAYER",
+            messages=messages,
+            rows=duplicated_rows.index,
+            column=None,
+            severity="WARNING",
+        )
 
     # ----------------------------------------------------------
     # 6. DATASET-LEVEL CHECKS
     # ----------------------------------------------------------
-    def check_dataset_level(self, df: pd.DataFrame):
+    def check_dataset_level(self, df: pd.DataFrame, ctx: Optional[dict] = None):
         """
         Global dataset checks.
         """
+        cols = (ctx or self.build_context(df))["cols"]
+
         if len(df) == 0:
             self.add_error(
                 code="EMPTY_DATASET",
@@ -243,49 +391,64 @@ class DataValidator:
             )
             return
 
-        if "team" in df.columns and "player_name" in df.columns:
-            counts = df.groupby("team")["player_name"].nunique()
-            for team, count in counts.items():
-                if count > 20:
-                    self.add_error(
-                        code="TOO_MANY_PLAYERS",
-                        message=f"Team '{team}' has {count} unique players (too high).",
-                        row=None,
-                        column="team",
-                        severity="WARNING",
-                    )
+        if "team" in cols and "player_name" in cols:
+            # one hash pass over (team, player) pairs, then count per team —
+            # cheaper than groupby().nunique() building a set per group
+            pairs = df[["team", "player_name"]].dropna().drop_duplicates()
+            counts = pairs.groupby("team", observed=True).size()
+            for team, count in counts[counts > 20].items():
+                self.add_error(
+                    code="TOO_MANY_PLAYERS",
+                    message=f"Team '{team}' has {count} unique players (too high).",
+                    row=None,
+                    column="team",
+                    severity="WARNING",
+                )
 
     # ----------------------------------------------------------
     # MAIN VALIDATION ORCHESTRATOR
     # ----------------------------------------------------------
     def validate(self, df: pd.DataFrame) -> List[dict]:
-        self.errors = []
+        self.run_checks(df)
+        return self.errors
 
-        self.check_required_columns(df)
-        self.check_numeric_ranges(df)
-        self.check_allowed_values(df)
-        self.check_missing_critical_values(df)
-        self.check_duplicates(df)
-        self.check_dataset_level(df)
+    def validate_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        self.run_checks(df)
+        return self.to_frame()
 
-        return self.errors
+    def run_checks(self, df: pd.DataFrame):
+        self._reset()
+        ctx = self.build_context(df)
+
+        self.check_required_columns(df, ctx)
+        self.check_numeric_ranges(df, ctx)
+        self.check_allowed_values(df, ctx)
+        self.check_missing_critical_values(df, ctx)
+        self.check_duplicates(df, ctx)
+        self.check_dataset_level(df, ctx)
 
 
 # ----------------------------------------------------------
 # PIPELINE-FACING HELPER
 # ----------------------------------------------------------
-def validate_data(df_clean: pd.DataFrame) -> pd.DataFrame:
+def validate_data(df_clean: pd.DataFrame | str | Path) -> pd.DataFrame:
     """
     Wrapper for pipeline integration.
     Returns a DataFrame of validation errors.
+
+    `df_clean` may also be the path of the cleaned Parquet file; only
+    VALIDATION_COLUMNS are read from it. Row labels match the in-memory
+    frame when the file was written with its index (as pipeline.py does).
     """
+    if not isinstance(df_clean, pd.DataFrame):
+        df_clean = load_parquet(df_clean, columns=VALIDATION_COLUMNS)
+
     validator = DataValidator()
-    errors = validator.validate(df_clean)
+    errors_df = validator.validate_frame(df_clean)
 
-    if not errors:
+    if errors_df.empty:
         print("[validate] No validation errors found ✅")
-        return pd.DataFrame(columns=["row", "column", "severity", "code", "message"])
+        return errors_df
 
-    errors_df = pd.DataFrame(errors)
     print(f"[validate] Validation completed with {len(errors_df)} issues.")
-    return errors_df
\ No newline at end of file
+    return errors_df
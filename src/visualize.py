@@ -1,21 +1,61 @@
 # src/visualize.py
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
+from src.extract import load_parquet, parquet_columns
 
-def _find_column(df: pd.DataFrame, candidates: list[str]) -> Optional[str]:
+# The charts are intermediate artifacts (the report scales them onto a page),
+# so a moderate DPI and zlib level 1 keep PNG encoding cheap.
+CHART_DPI = 100
+PNG_PIL_KWARGS = {"compress_level": 1}
+
+# Long paths are drawn in chunks rather than as one huge path.
+AGG_RC = {"agg.path.chunksize": 10000}
+
+# Chart workers are started from a fork server rather than forked from the
+# caller: the caller may have threads inside pyarrow (e.g. a background
+# Parquet write), and forking a process mid-lock can deadlock the child.
+POOL_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Above this many rows the scatter background becomes a hexbin density:
+# a fixed number of cells instead of one marker per player-season.
+SCATTER_HEXBIN_THRESHOLD = 50_000
+
+# Each chart worker re-imports pandas/pyarrow/matplotlib (about a second),
+# which is more than the three charts take to draw on a normal season file,
+# so worker processes are only used above this many rows.
+POOL_MIN_ROWS = 50_000
+
+
+@lru_cache(maxsize=8)
+def _lower_map(cols: tuple[str, ...]) -> dict[str, str]:
+    """Lower-cased column name → original name, cached per column set."""
+    return {c.lower(): c for c in cols}
+
+
+def _find_column(columns: Sequence[str], candidates: list[str]) -> Optional[str]:
     """
-    Try to find a column in df whose name matches one of the candidates
-    (either exact, case-insensitive, or substring match).
+    Try to find a column among `columns` whose name matches one of the
+    candidates (either exact, case-insensitive, or substring match).
     """
-    cols = list(df.columns)
+    cols = tuple(columns)
 
     # 1) exact case-insensitive match
-    lower_map = {c.lower(): c for c in cols}
+    lower_map = _lower_map(cols)
     for cand in candidates:
         if cand.lower() in lower_map:
             return lower_map[cand.lower()]
@@ -29,88 +69,199 @@ def _find_column(df: pd.DataFrame, candidates: list[str]) -> Optional[str]:
     return None
 
 
+def _float_values(values: pd.Series) -> np.ndarray:
+    """
+    Plot data as a plain float ndarray (NaN for missing). float64 columns
+    are handed over as a view, without a copy; nullable Int32/Float32 ones
+    are converted once here instead of reaching matplotlib as object arrays.
+    """
+    if values.dtype == np.float64:
+        return values.to_numpy(copy=False)
+    return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+@contextmanager
+def _new_figure(figsize=(8, 5)):
+    """
+    Build a Figure/Axes pair directly on an Agg canvas.
+
+    Bypasses pyplot entirely: no global figure registry to manage and no
+    backend switching. The figure is cleared on exit, which breaks the
+    figure/axes/artist reference cycles so its memory is released right
+    away instead of waiting for the cyclic garbage collector.
+    """
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    try:
+        yield fig, fig.add_subplot(111)
+    finally:
+        fig.clear()
+
+
+def _render_bar(team_means: pd.Series, out_path: Path) -> Path:
+    """Bar chart: average points per game by team (one value per team)."""
+    grouped = team_means.sort_values()
+
+    with _new_figure() as (fig, ax):
+        ax.bar(grouped.index.astype(str), _float_values(grouped), width=0.5)
+        ax.tick_params(axis="x", labelrotation=90)
+        ax.set_title("Average Points per Game by Team")
+        ax.set_xlabel("Team")
+        ax.set_ylabel("Points per Game")
+        fig.tight_layout()
+
+        fig.savefig(out_path, dpi=CHART_DPI, pil_kwargs=PNG_PIL_KWARGS)
+    return out_path
+
+
+def _render_hist(df: pd.DataFrame, points_col: str, out_path: Path) -> Path:
+    """Histogram: distribution of points per game."""
+    points = _float_values(df[points_col])
+
+    with _new_figure() as (fig, ax):
+        ax.hist(points[~np.isnan(points)], bins=10, edgecolor="black")
+        ax.set_title("Distribution of Points per Game")
+        ax.set_xlabel("Points per Game")
+        ax.set_ylabel("Frequency")
+        fig.tight_layout()
+
+        fig.savefig(out_path, dpi=CHART_DPI, pil_kwargs=PNG_PIL_KWARGS)
+    return out_path
+
+
+def _render_scatter(
+    df: pd.DataFrame,
+    anomalies: pd.DataFrame,
+    games_col: str,
+    points_col: str,
+    out_path: Path,
+) -> Path:
+    """
+    Scatter: points vs games, with anomalies highlighted.
+
+    Large frames draw the normal rows as a hexbin density; only the
+    anomalies stay individual markers.
+    """
+    x, y = _float_values(df[games_col]), _float_values(df[points_col])
+
+    with matplotlib.rc_context(AGG_RC), _new_figure() as (fig, ax):
+        if len(df) > SCATTER_HEXBIN_THRESHOLD:
+            present = ~(np.isnan(x) | np.isnan(y))
+            ax.hexbin(
+                x[present],
+                y[present],
+                gridsize=60,
+                mincnt=1,
+                cmap="Blues",
+                rasterized=True,
+                label="Normal",
+            )
+        else:
+            ax.scatter(x, y, alpha=0.6, rasterized=True, label="Normal")
+
+        ax.scatter(
+            _float_values(anomalies[games_col]),
+            _float_values(anomalies[points_col]),
+            color="red",
+            edgecolor="black",
+            s=80,
+            label="Anomaly",
+        )
+
+        ax.set_title("Points vs Games Played (Anomalies Highlighted)")
+        ax.set_xlabel("Games Played")
+        ax.set_ylabel("Points per Game")
+        ax.legend()
+        fig.tight_layout()
+
+        fig.savefig(out_path, dpi=CHART_DPI, pil_kwargs=PNG_PIL_KWARGS)
+    return out_path
+
+
 def create_visualizations(
-    df_clean: pd.DataFrame,
+    df_clean: pd.DataFrame | str | Path,
     anomalies: Optional[pd.DataFrame] = None,
     output_dir: str | Path = "visuals",
 ) -> Dict[str, Path]:
     """
     Create basic visualizations for WNBA stats and save them as PNG files.
 
+    The charts are rendered in turn. For frames above POOL_MIN_ROWS rows on
+    a multi-core machine, each chart is instead rendered in its own worker
+    process, sent only the columns (or aggregate) it draws. Workers start by
+    re-importing `__main__`, so a script that reaches that path must call
+    this under an `if __name__ == "__main__":` guard.
+
+    `df_clean` may also be the path of the cleaned Parquet file; then only
+    the team / points / games columns are read from it.
+
     Returns a dict mapping figure names to their file paths.
     """
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    output_paths: Dict[str, Path] = {}
-
     # --- figure out which columns to use ---
-    team_col = _find_column(df_clean, ["team", "team_name"])
-    points_col = _find_column(df_clean, ["points_per_game", "pts", "points"])
-    games_col = _find_column(df_clean, ["games_played", "games", "g"])
+    from_parquet = not isinstance(df_clean, pd.DataFrame)
+    columns = parquet_columns(df_clean) if from_parquet else df_clean.columns
+    team_col = _find_column(columns, ["team", "team_name"])
+    points_col = _find_column(columns, ["points_per_game", "pts", "points"])
+    games_col = _find_column(columns, ["games_played", "games", "g"])
 
     print(f"[visualize] Using columns: team={team_col}, points={points_col}, games={games_col}")
 
-    # 1) Bar chart: average points per game by team
-    if team_col and points_col:
-        fig, ax = plt.subplots(figsize=(8, 5))
-        grouped = df_clean.groupby(team_col)[points_col].mean().sort_values()
+    if from_parquet:
+        needed = [c for c in dict.fromkeys((team_col, points_col, games_col)) if c]
+        df_clean = load_parquet(df_clean, columns=needed)
 
-        grouped.plot(kind="bar", ax=ax)
-        ax.set_title("Average Points per Game by Team")
-        ax.set_xlabel("Team")
-        ax.set_ylabel("Points per Game")
-        plt.tight_layout()
+    # name -> (render function, args)
+    tasks = {}
 
-        out_path = output_dir / "points_by_team.png"
-        fig.savefig(out_path, dpi=150)
-        plt.close(fig)
-        output_paths["points_by_team"] = out_path
+    # 1) Bar chart: average points per game by team
+    if team_col and points_col:
+        # aggregate here, once, so the worker receives one row per team
+        # instead of the whole frame; observed=True skips unused categories
+        team_means = df_clean.groupby(team_col, observed=True)[points_col].mean()
+        tasks["points_by_team"] = (
+            _render_bar,
+            (team_means, output_dir / "points_by_team.png"),
+        )
 
     # 2) Histogram: distribution of points per game
     if points_col:
-        fig, ax = plt.subplots(figsize=(8, 5))
-        df_clean[points_col].plot(kind="hist", bins=10, ax=ax, edgecolor="black")
-        ax.set_title("Distribution of Points per Game")
-        ax.set_xlabel("Points per Game")
-        ax.set_ylabel("Frequency")
-        plt.tight_layout()
-
-        out_path = output_dir / "points_distribution.png"
-        fig.savefig(out_path, dpi=150)
-        plt.close(fig)
-        output_paths["points_distribution"] = out_path
+        tasks["points_distribution"] = (
+            _render_hist,
+            (df_clean[[points_col]], points_col, output_dir / "points_distribution.png"),
+        )
 
     # 3) Scatter: points vs games, highlight anomalies if provided
     if points_col and games_col and anomalies is not None and not anomalies.empty:
         # make sure anomalies have the same columns
         if points_col in anomalies.columns and games_col in anomalies.columns:
-            fig, ax = plt.subplots(figsize=(8, 5))
-            ax.scatter(
-                df_clean[games_col],
-                df_clean[points_col],
-                alpha=0.6,
-                label="Normal",
+            xy = list(dict.fromkeys([games_col, points_col]))
+            tasks["anomalies_scatter"] = (
+                _render_scatter,
+                (
+                    df_clean[xy],
+                    anomalies[xy],
+                    games_col,
+                    points_col,
+                    output_dir / "anomalies_scatter.png",
+                ),
             )
 
-            ax.scatter(
-                anomalies[games_col],
-                anomalies[points_col],
-                color="red",
-                edgecolor="black",
-                s=80,
-                label="Anomaly",
-            )
+    if not tasks:
+        return {}
 
-            ax.set_title("Points vs Games Played (Anomalies Highlighted)")
-            ax.set_xlabel("Games Played")
-            ax.set_ylabel("Points per Game")
-            ax.legend()
-            plt.tight_layout()
+    workers = min(len(tasks), os.cpu_count() or 1)
+    if workers == 1 or len(df_clean) <= POOL_MIN_ROWS:
+        # worker start-up would cost more than drawing the charts here
+        return {name: func(*args) for name, (func, args) in tasks.items()}
 
-            out_path = output_dir / "anomalies_scatter.png"
-            fig.savefig(out_path, dpi=150)
-            plt.close(fig)
-            output_paths["anomalies_scatter"] = out_path
+    mp_context = multiprocessing.get_context(POOL_START_METHOD)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+        futures = {name: pool.submit(func, *args) for name, (func, args) in tasks.items()}
+        output_paths: Dict[str, Path] = {
+            name: future.result() for name, future in futures.items()
+        }
 
-    return output_paths
\ No newline at end of file
+    return output_paths
@@ -1,5 +1,6 @@
+import numpy as np
 import pandas as pd
-from src.detect_anomalies import detect_anomalies
+from src.detect_anomalies import _numeric_matrix, detect_anomalies, detect_anomalies_chunked
 
 def test_detects_high_outlier():
     df = pd.DataFrame({
@@ -21,4 +22,44 @@ def test_returns_empty_when_no_outliers():
 
     anomalies = detect_anomalies(df)
 
-    assert anomalies.empty
\ No newline at end of file
+    assert anomalies.empty
+
+
+def test_numeric_matrix_is_column_major():
+    # a frame wrapping a row-major array is the worst case for column scans
+    df = pd.DataFrame(np.arange(12, dtype=float).reshape(4, 3), columns=["a", "b", "c"])
+    df["player_name"] = ["A", "B", "C", "D"]
+
+    values = _numeric_matrix(df)
+
+    assert values.shape == (4, 3)
+    assert values.flags.f_contiguous
+
+
+def test_chunked_detection_matches_in_memory(tmp_path):
+    csv_path = tmp_path / "players.csv"
+    pd.DataFrame({
+        "player_name": list("ABCDEFGH"),
+        "points_per_game": [20, 21, 19, 22, 20, 18, 21, 60],  # 60 is an outlier
+        "games_played": [30, 31, 29, 30, 28, 30, 32, 31],
+    }).to_csv(csv_path, index=False)
+
+    expected = detect_anomalies(pd.read_csv(csv_path))
+    anomalies = detect_anomalies_chunked(csv_path, chunksize=3)
+
+    assert list(anomalies["player_name"]) == list(expected["player_name"]) == ["H"]
+    assert list(anomalies.index) == list(expected.index)
+
+
+def test_small_sample_rule_applies_per_column():
+    # each tiny column is judged on its own values; missing values are skipped
+    df = pd.DataFrame({
+        "player_name": ["A", "B", "C", "D"],
+        "points_per_game": [20, 21, np.nan, 90],  # 90 is an outlier
+        "assists_per_game": [-40, 5, 5.2, 5.1],   # -40 is an outlier
+        "rebounds_per_game": [np.nan, np.nan, np.nan, 7],  # too few values
+    })
+
+    anomalies = detect_anomalies(df)
+
+    assert list(anomalies["player_name"]) == ["A", "D"]
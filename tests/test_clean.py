@@ -65,4 +65,48 @@ def test_handle_missing_values():
 
     # Text missing → "Unknown"
     assert cleaned.loc[1, "player_name"] == "Unknown"
-    assert cleaned.loc[2, "team"] == "Unknown"
\ No newline at end of file
+    assert cleaned.loc[2, "team"] == "Unknown"
+
+# ------------------------------------------------------
+# 4. Test: Categorical team labels are trimmed and normalized
+# ------------------------------------------------------
+def test_clean_normalizes_categorical_team():
+    raw = pd.DataFrame({
+        "player_name": ["A", "B", "C"],
+        "team": pd.Categorical([" MIN ", "Minnesota", None]),
+    })
+
+    cleaned = clean_data(raw)
+
+    assert list(cleaned["team"]) == ["Minnesota Lynx", "Minnesota Lynx", "Unknown"]
+    assert list(cleaned["team"].cat.categories) == ["Minnesota Lynx", "Unknown"]
+
+
+# ------------------------------------------------------
+# 5. Test: Nullable integer columns get a whole-number fill
+# ------------------------------------------------------
+def test_handle_missing_values_nullable_int():
+    cleaner = DataCleaner()
+
+    df = pd.DataFrame({
+        "games_played": pd.array([30, None, 33], dtype="Int32"),
+        "points_per_game": pd.array([26.9, 20.4, None], dtype="Float32"),
+    })
+
+    cleaned = cleaner.handle_missing_values(df)
+
+    assert cleaned["games_played"].dtype == "Int32"
+    assert cleaned.loc[1, "games_played"] == 32  # mean 31.5, rounded
+    assert cleaned["points_per_game"].dtype == "Float32"
+    assert not cleaned["points_per_game"].isna().any()
+
+
+# ------------------------------------------------------
+# 6. Test: Mixed-type player names survive cleaning
+# ------------------------------------------------------
+def test_clean_stringifies_mixed_player_names():
+    raw = pd.DataFrame({"player_name": pd.Series(["A", 5, 3.5, None], dtype=object)})
+
+    cleaned = clean_data(raw)
+
+    assert list(cleaned["player_name"]) == ["A", "5", "3.5", "Unknown"]
@@ -4,7 +4,7 @@ import pandas as pd
 import pytest
 from pathlib import Path
 
-from src.extract import load_raw_csv
+from src.extract import load_parquet, load_raw_csv, parquet_shape
 
 
 def test_load_raw_csv_reads_data(tmp_path):
@@ -37,4 +37,90 @@ def test_load_raw_csv_empty_file_raises(tmp_path):
     csv_path.write_text("")  # create an empty file
 
     with pytest.raises(ValueError):
-        load_raw_csv(csv_path)
\ No newline at end of file
+        load_raw_csv(csv_path)
+
+
+def test_load_raw_csv_reuses_arrow_cache(tmp_path):
+    """Second load of an unchanged file comes from the Arrow cache."""
+    csv_path = tmp_path / "players.csv"
+    pd.DataFrame({"player_name": ["A", "B"], "points_per_game": [1.0, 2.0]}).to_csv(
+        csv_path, index=False
+    )
+
+    first = load_raw_csv(csv_path)
+    caches = list(tmp_path.glob("players.*.arrow"))
+    assert len(caches) == 1
+
+    second = load_raw_csv(csv_path)
+    pd.testing.assert_frame_equal(first, second)
+
+    # changing the file invalidates (and replaces) the old cache
+    csv_path.write_text("player_name,points_per_game\nC,3.0\n")
+    third = load_raw_csv(csv_path)
+    assert list(third["player_name"]) == ["C"]
+    assert list(tmp_path.glob("players.*.arrow")) != caches
+    assert len(list(tmp_path.glob("players.*.arrow"))) == 1
+
+
+def test_load_raw_csv_uses_known_column_types(tmp_path):
+    """Known stat columns get compact types; bad values fall back to inference."""
+    csv_path = tmp_path / "typed.csv"
+    csv_path.write_text("Player Name,games_played,points_per_game\nA,30,26.9\nB,,20.4\n")
+
+    df = load_raw_csv(csv_path, use_cache=False)
+    # nullable types: the missing game count doesn't upcast the column
+    assert df["points_per_game"].dtype == "Float32"
+    assert df["games_played"].dtype == "Int32"
+    assert df["games_played"].isna().sum() == 1
+
+    dirty_path = tmp_path / "dirty.csv"
+    dirty_path.write_text("player_name,games_played\nA,thirty\nB,20\n")
+
+    dirty = load_raw_csv(dirty_path, use_cache=False)
+    assert list(dirty["games_played"]) == ["thirty", "20"]
+
+
+def test_load_raw_csv_reads_team_as_category(tmp_path):
+    """Team labels come back categorical, even when numeric typing falls back."""
+    csv_path = tmp_path / "teams.csv"
+    csv_path.write_text("player_name,Team,games_played\nA,MIN,thirty\nB,MIN,20\nC,LVA,\n")
+
+    df = load_raw_csv(csv_path, use_cache=False)
+
+    assert isinstance(df["Team"].dtype, pd.CategoricalDtype)
+    assert set(df["Team"].cat.categories) == {"MIN", "LVA"}
+    assert df["Team"].isna().sum() == 0
+
+
+def test_load_parquet_projects_columns(tmp_path):
+    """Only the requested columns that exist are read back."""
+    path = tmp_path / "cleaned.parquet"
+    pd.DataFrame({
+        "player_name": ["A", "B"],
+        "team": ["Las Vegas Aces", "Minnesota Lynx"],
+        "points_per_game": [26.9, 20.4],
+    }).to_parquet(path, index=False)
+
+    df = load_parquet(path, columns=["team", "points_per_game", "position"])
+
+    assert list(df.columns) == ["team", "points_per_game"]
+    assert parquet_shape(path) == (2, 3)
+
+
+def test_load_raw_csv_keeps_caches_of_other_files(tmp_path):
+    """Re-parsing one file must not delete caches of similarly named files."""
+    season = tmp_path / "players.2023.csv"
+    season.write_text("player_name,points_per_game\nA,1.0\n")
+    load_raw_csv(season)
+    season_caches = list(tmp_path.glob("players.2023.*.arrow"))
+    assert len(season_caches) == 1
+
+    unrelated = tmp_path / "players.notes_v2.arrow"
+    unrelated.write_bytes(b"")
+
+    current = tmp_path / "players.csv"
+    current.write_text("player_name,points_per_game\nB,2.0\n")
+    load_raw_csv(current)
+
+    assert all(p.exists() for p in season_caches)
+    assert unrelated.exists()
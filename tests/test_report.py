@@ -5,7 +5,7 @@ from pathlib import Path
 import pandas as pd
 import matplotlib.pyplot as plt
 
-from src.report import generate_report
+from src.report import _summary_lines, generate_report
 
 
 def _sample_df():
@@ -76,4 +76,39 @@ def test_generate_report_handles_empty_anomalies_and_errors(tmp_path):
     )
 
     assert pdf_path.exists()
-    assert pdf_path.stat().st_size > 0
\ No newline at end of file
+    assert pdf_path.stat().st_size > 0
+
+
+def test_summary_caps_listed_validation_issues():
+    df_clean = _sample_df()
+    validation_errors = pd.DataFrame({
+        "row": range(5),
+        "severity": "ERROR",
+        "code": "OUT_OF_RANGE",
+        "message": [f"Issue {i}" for i in range(5)],
+    })
+
+    lines = _summary_lines(df_clean, pd.DataFrame(), validation_errors, n_failure_cases=2)
+
+    assert "Validation issues: 5" in lines
+    assert "Example validation issues (showing 2 of 5):" in lines
+    assert [line for line in lines if line.startswith("  - ")] == [
+        "  - [ERROR] OUT_OF_RANGE: Issue 0",
+        "  - [ERROR] OUT_OF_RANGE: Issue 1",
+    ]
+
+
+def test_generate_report_from_parquet(tmp_path):
+    path = tmp_path / "cleaned.parquet"
+    _sample_df().to_parquet(path, index=False)
+
+    pdf_path = generate_report(
+        df_clean=path,
+        anomalies=None,
+        validation_errors=None,
+        viz_paths={},
+        output_path=tmp_path / "report.pdf",
+    )
+
+    assert pdf_path.exists()
+    assert pdf_path.stat().st_size > 0
@@ -51,4 +51,153 @@ def test_no_errors_for_good_data():
     })
 
     errors_df = validate_data(df)
-    assert errors_df.empty
\ No newline at end of file
+    assert errors_df.empty
+
+
+def _rows(errors, code):
+    return sorted(e["row"] for e in errors if e["code"] == code)
+
+
+def test_invalid_numeric_values():
+    df = pd.DataFrame({
+        "player_name": ["A", "B", "C"],
+        "team": ["Minnesota Lynx"] * 3,
+        "points_per_game": ["20.5", "twenty", None],
+        "games_played": [10, 12, 14],
+    }, index=[10, 20, 30])
+
+    errors = DataValidator().validate(df)
+
+    assert _rows(errors, "INVALID_NUMERIC") == [20]
+
+
+def test_nan_text_is_treated_as_missing():
+    df = pd.DataFrame({
+        "player_name": ["A", "B", "C", "D"],
+        "team": ["Minnesota Lynx"] * 4,
+        "points_per_game": ["nan", " NaN ", "-nan", "nana"],
+        "games_played": [10] * 4,
+    }, index=[10, 10, 20, 30])
+
+    errors = DataValidator().validate(df)
+
+    assert _rows(errors, "INVALID_NUMERIC") == [30]
+    assert _rows(errors, "OUT_OF_RANGE") == []
+
+
+def test_missing_critical_values():
+    df = pd.DataFrame({
+        "player_name": ["A", None, "  ", "Unknown", " Unknown "],
+        "team": ["Minnesota Lynx", "Minnesota Lynx", None, " ", "Atlanta Dream"],
+        "points_per_game": [20.0] * 5,
+        "games_played": [10] * 5,
+    }, index=[10, 20, 30, 40, 50])
+
+    errors = DataValidator().validate(df)
+
+    # only the exact "Unknown" placeholder counts as missing
+    assert _rows(errors, "MISSING_PLAYER_NAME") == [20, 30, 40]
+    assert _rows(errors, "MISSING_TEAM") == [30, 40]
+
+
+def test_invalid_position_values():
+    df = pd.DataFrame({
+        "player_name": ["A", "B", "C"],
+        "team": ["Minnesota Lynx"] * 3,
+        "position": ["G", "Goalie", None],
+        "points_per_game": [20.0] * 3,
+        "games_played": [10] * 3,
+    }, index=[10, 20, 30])
+
+    errors = DataValidator().validate(df)
+
+    assert _rows(errors, "INVALID_POSITION") == [20]
+
+
+def test_duplicate_players():
+    df = pd.DataFrame({
+        "player_name": ["A", "B", "A"],
+        "team": ["Minnesota Lynx", "Minnesota Lynx", "Minnesota Lynx"],
+        "points_per_game": [20.0, 21.0, 22.0],
+        "games_played": [10, 11, 12],
+    }, index=[10, 20, 30])
+
+    errors = DataValidator().validate(df)
+
+    assert _rows(errors, "DUPLICATE_PLAYER") == [10, 30]
+    assert any(
+        e["message"] == "Duplicate player/team combination: A / Minnesota Lynx"
+        for e in errors
+    )
+
+
+def test_validate_data_sees_in_place_edits():
+    df = pd.DataFrame({
+        "player_name": ["A", "B", "C", "D", "E"],
+        "team": ["Minnesota Lynx"] * 5,
+        "points_per_game": [20.0, 21.0, 22.0, 23.0, 24.0],
+        "games_played": [30] * 5,
+    })
+    assert validate_data(df).empty
+
+    # edit middle rows of the same frame object
+    df.loc[2, "points_per_game"] = 999
+    df.loc[3, "team"] = "Mars"
+
+    errors = validate_data(df)
+    assert sorted(errors["code"]) == ["INVALID_TEAM", "OUT_OF_RANGE"]
+    assert sorted(errors["row"]) == [2, 3]
+
+
+def test_validate_data_reads_parquet_path(tmp_path):
+    df = pd.DataFrame({
+        "player_name": ["A", "B"],
+        "team": ["Mars Meteors", "Las Vegas Aces"],
+        "points_per_game": [10.0, 120.0],
+        "games_played": [5, 10],
+        "notes": ["unused", "column"],
+    }, index=[2, 3])  # gaps left by drop_duplicates
+    path = tmp_path / "cleaned.parquet"
+    df.to_parquet(path)
+
+    from_path = validate_data(path)
+
+    pd.testing.assert_frame_equal(from_path, validate_data(df.copy()))
+    assert sorted(from_path["row"]) == [2, 3]
+
+
+def _cleaned(names, teams):
+    from src.clean import clean_data
+
+    return clean_data(pd.DataFrame({
+        "player_name": names,
+        "team": teams,
+        "points_per_game": [20.0 + i for i in range(len(names))],
+        "games_played": [10] * len(names),
+    }))
+
+
+def test_validate_cleaned_frame_without_duplicates():
+    df = _cleaned(["A", "B"], ["MIN", "LVA"])
+    assert isinstance(df["team"].dtype, pd.CategoricalDtype)
+
+    assert validate_data(df).empty
+
+
+def test_validate_cleaned_frame_with_duplicates():
+    df = _cleaned(["A", "B", "A"], ["MIN", "LVA", "Minnesota"])
+
+    errors = validate_data(df)
+
+    assert sorted(errors["row"]) == [0, 2]
+    assert set(errors["message"]) == {
+        "Duplicate player/team combination: A / Minnesota Lynx"
+    }
+
+
+def test_validate_empty_cleaned_frame():
+    df = _cleaned(["A"], ["MIN"]).iloc[0:0]
+
+    errors = validate_data(df)
+
+    assert errors["code"].tolist() == ["EMPTY_DATASET"]
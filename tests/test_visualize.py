@@ -2,7 +2,9 @@
 
 from pathlib import Path
 import pandas as pd
+from matplotlib.axes import Axes
 
+import src.visualize as visualize
 from src.visualize import create_visualizations
 
 
@@ -41,4 +43,67 @@ def test_create_visualizations_with_anomalies(tmp_path):
     assert "anomalies_scatter" in output_paths
     scatter_path = output_paths["anomalies_scatter"]
     assert scatter_path.exists()
-    assert scatter_path.suffix == ".png"
\ No newline at end of file
+    assert scatter_path.suffix == ".png"
+
+
+def test_large_scatter_uses_hexbin(tmp_path, monkeypatch):
+    calls = []
+    original_hexbin = Axes.hexbin
+
+    def recording_hexbin(self, x, y, *args, **kwargs):
+        calls.append(len(x))
+        return original_hexbin(self, x, y, *args, **kwargs)
+
+    monkeypatch.setattr(Axes, "hexbin", recording_hexbin)
+    df = _sample_df()
+
+    # below the threshold: plain scatter
+    visualize._render_scatter(
+        df, df.iloc[[2]], "games_played", "points_per_game", tmp_path / "small.png"
+    )
+    assert calls == []
+
+    # pretend the sample is large so the density background is drawn
+    monkeypatch.setattr(visualize, "SCATTER_HEXBIN_THRESHOLD", 2)
+    out_path = visualize._render_scatter(
+        df, df.iloc[[2]], "games_played", "points_per_game", tmp_path / "scatter.png"
+    )
+
+    assert calls == [len(df)]
+    assert out_path.exists()
+
+
+def test_create_visualizations_from_parquet(tmp_path):
+    path = tmp_path / "cleaned.parquet"
+    _sample_df().to_parquet(path, index=False)
+
+    output_paths = create_visualizations(path, output_dir=tmp_path / "charts")
+
+    assert set(output_paths) == {"points_by_team", "points_distribution"}
+    assert all(p.exists() for p in output_paths.values())
+
+
+def test_create_visualizations_in_worker_processes(tmp_path, monkeypatch):
+    # force the process-pool path even on a single-core machine
+    monkeypatch.setattr(visualize.os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(visualize, "POOL_MIN_ROWS", 2)
+    df = _sample_df()
+
+    output_paths = create_visualizations(df, anomalies=df.iloc[[2]], output_dir=tmp_path)
+
+    assert set(output_paths) == {"points_by_team", "points_distribution", "anomalies_scatter"}
+    assert all(p.exists() for p in output_paths.values())
+
+
+def test_small_frames_render_without_worker_processes(tmp_path, monkeypatch):
+    monkeypatch.setattr(visualize.os, "cpu_count", lambda: 4)
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("worker pool started for a small frame")
+
+    monkeypatch.setattr(visualize, "ProcessPoolExecutor", no_pool)
+    df = _sample_df()
+
+    output_paths = create_visualizations(df, anomalies=df.iloc[[2]], output_dir=tmp_path)
+
+    assert set(output_paths) == {"points_by_team", "points_distribution", "anomalies_scatter"}